@@ -4,23 +4,139 @@ Rule Test Runner - Validates project compliance with Universal Rules
 Automatically checks for presence of required files, configurations, and patterns.
 """
 
+import itertools
+import mmap
 import os
-import json
-import yaml
 import re
-import glob
-import subprocess
+import threading
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Iterable, Iterator, BinaryIO, TextIO, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    # google-re2 matches in guaranteed linear time; optional, stdlib re otherwise
+    import re2 as _secret_re_engine
+except ImportError:
+    _secret_re_engine = re
+
+# Quoted literals assigned to password, api_key, secret or token, fused
+# into one pattern so each line is scanned once instead of once per keyword.
+# Whitespace and the quoted value must not cross a newline: the pattern runs
+# over whole buffers but matches stay confined to a single line.
+SECRET_RE = _secret_re_engine.compile(rb'(?i)(?:password|api_key|secret|token)[^\S\n]*=[^\S\n]*["\'][^"\'\n]+["\']')
+
+# Health endpoint markers; /healthz is already matched by its /health prefix
+HEALTH_NEEDLES = (b"/health", b"/ready")
+
+# Authentication keywords in one case-insensitive pass ("oauth" is covered by "auth")
+AUTH_RE = re.compile(rb"auth|jwt|saml|ldap", re.IGNORECASE)
+
+# Versioned API paths such as /v1/ or /v2/
+VERSIONED_RE = re.compile(rb"/v\d+/")
+
+# Files with more distinct secret hits than this get one summary violation
+SECRET_REPORT_LIMIT = 10
+
+# Lowercases ASCII letters in a bytes object without decoding it
+ASCII_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+# Directories never descended into when indexing the project tree
+SKIP_DIRS = {".git", "node_modules", "venv", ".venv"}
+
+# Build output directories ignored by the versioned-endpoint probe (06A) only;
+# other scans, notably 05B secrets, still cover them
+OUTPUT_DIRS = {"dist", "build", "target"}
+
+# Directories whose listings presence probes need, relative to the project root
+PROBED_DIRS = ("", "docs", "docker", "build", ".github", ".circleci")
+
+# Rule tests run concurrently, leaving two cores free for the rest of the system
+MAX_WORKERS = max(1, (os.cpu_count() or 1) - 2)
+
+# Read size for streaming file scans; also the largest file kept in the read cache
+SCAN_BLOCK_SIZE = 64 * 1024
+
+# Maximum number of files kept in a runner's read cache
+FILE_CACHE_ENTRIES = 4096
+
+def _iter_blocks(stream: BinaryIO, block_size: int = SCAN_BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield newline-aligned blocks of a binary stream, carrying partial lines over"""
+    # Pieces of an unfinished line are collected and joined once a newline
+    # arrives, so long newline-free files (minified bundles) stay linear
+    pending: List[bytes] = []
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            if pending:
+                yield b"".join(pending)
+            return
+        cut = block.rfind(b"\n") + 1
+        if cut:
+            pending.append(block[:cut])
+            yield b"".join(pending)
+            pending = [block[cut:]] if cut < len(block) else []
+        else:
+            pending.append(block)
+
+def _root_prefix(root: str) -> str:
+    """Prefix that _iter_files puts in front of paths relative to root"""
+    return "" if root == os.curdir else os.path.join(root, "")
+
+def _iter_files(root: str) -> Iterator[Tuple[str, str]]:
+    """Yield (name, path) for every file below root, skipping SKIP_DIRS"""
+    # DirEntry type checks use the d_type cached by readdir, so unlike rglob
+    # no per-file stat() or Path object is needed. Paths keep pathlib's form:
+    # a root of "." yields "src/app.py" rather than "./src/app.py".
+    stack = [(root, _root_prefix(root))]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append((path, path + os.sep))
+                elif entry.is_file():
+                    yield entry.name, path
+
+def _mmap_contains(file_path: str, needles: Iterable[bytes]) -> bool:
+    """Return True if the file contains any of the needles, without reading it into memory"""
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return any(mm.find(needle) >= 0 for needle in needles)
+
+def _mmap_search(file_path: str, pattern: "re.Pattern[bytes]") -> bool:
+    """Return True if the pattern matches anywhere in the file, without reading it into memory"""
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return pattern.search(mm) is not None
+
+def _secret_lines_in_blocks(blocks: Iterable[bytes]) -> Iterator[Tuple[int, bytes]]:
+    """Yield (line number, line) for each line holding a potential hardcoded secret"""
+    line_base = 1
+    for block in blocks:
+        line, pos, last_line = line_base, 0, None
+        for match in SECRET_RE.finditer(block):
+            line += block.count(b"\n", pos, match.start())
+            pos = match.start()
+            if line != last_line:
+                start = block.rfind(b"\n", 0, pos) + 1
+                end = block.find(b"\n", match.end())
+                yield line, block[start:end if end != -1 else len(block)]
+                last_line = line
+        line_base += block.count(b"\n")
+
 class Severity(Enum):
     MUST = "MUST"
     SHOULD = "SHOULD" 
     MAY = "MAY"
 
-@dataclass
+@dataclass(slots=True)
 class RuleViolation:
     rule_id: str
     severity: Severity
@@ -29,75 +145,178 @@ class RuleViolation:
     line_number: Optional[int] = None
     suggestion: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class RuleTestResult:
     rule_id: str
     passed: bool
     violations: List[RuleViolation]
     details: str
+    
+    def to_record(self) -> Dict[str, object]:
+        """Convert to a JSON-serializable dict"""
+        return {
+            "rule_id": self.rule_id,
+            "passed": self.passed,
+            "details": self.details,
+            "violations": [dict(asdict(v), severity=v.severity.value) for v in self.violations]
+        }
 
 class RuleTestRunner:
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root)
         self.violations: List[RuleViolation] = []
         
+        # Walk the tree once and bucket files by suffix and basename so each
+        # rule test reads from the index instead of re-traversing with rglob
+        self._files: List[str] = []
+        index: Dict[str, List[str]] = defaultdict(list)
+        self._root_prefix_len = len(_root_prefix(str(self.project_root)))
+        for name, path in _iter_files(str(self.project_root)):
+            self._files.append(path)
+            index[os.path.splitext(name)[1]].append(path)
+            index[name].append(path)
+        # A plain dict, read with .get(), so rule tests running on worker
+        # threads never insert keys into shared state
+        self._index: Dict[str, List[str]] = dict(index)
+        
+        # Presence probes check names against directory listings taken here,
+        # before the thread pool starts, instead of one stat() per candidate
+        self._listings = {rel_dir: self._scan_dir(rel_dir) for rel_dir in PROBED_DIRS}
+        self._root_entries = self._listings[""]
+        
+        # Contents of small files shared between rule tests for one run
+        self._file_cache: Dict[str, bytes] = {}
+        self._file_cache_lock = threading.Lock()
+    
+    def _scan_dir(self, rel_dir: str) -> Dict[str, bool]:
+        """Map entry names to is-directory for a project directory"""
+        try:
+            with os.scandir(self.project_root / rel_dir) as it:
+                return {entry.name: entry.is_dir() for entry in it}
+        except OSError:
+            return {}
+    
+    def _list_dir(self, rel_dir: str) -> Dict[str, bool]:
+        """Return the listing taken in __init__, scanning directories outside PROBED_DIRS uncached"""
+        listing = self._listings.get(rel_dir)
+        return listing if listing is not None else self._scan_dir(rel_dir)
+    
+    def _read_bytes(self, path: str) -> bytes:
+        """Read a whole file, caching small ones; scans of large files go through _contains/_search"""
+        data = self._file_cache.get(path)
+        if data is None:
+            data = Path(path).read_bytes()
+            if len(data) <= SCAN_BLOCK_SIZE:
+                with self._file_cache_lock:
+                    if len(self._file_cache) < FILE_CACHE_ENTRIES:
+                        self._file_cache[path] = data
+        return data
+    
+    def _contains(self, path: str, needles: Iterable[bytes]) -> bool:
+        """Check a file for any of the needles; small files come from the cache, large ones are mapped"""
+        if os.path.getsize(path) > SCAN_BLOCK_SIZE:
+            return _mmap_contains(path, needles)
+        data = self._read_bytes(path)
+        return any(needle in data for needle in needles)
+    
+    def _search(self, path: str, pattern: "re.Pattern[bytes]") -> bool:
+        """Check a file against a bytes pattern; small files come from the cache, large ones are mapped"""
+        if os.path.getsize(path) > SCAN_BLOCK_SIZE:
+            return _mmap_search(path, pattern)
+        return pattern.search(self._read_bytes(path)) is not None
+    
+    def _secret_lines(self, file_path: str) -> Iterator[Tuple[int, bytes]]:
+        """Scan a file for hardcoded secrets, streaming it when it exceeds one block"""
+        if os.path.getsize(file_path) <= SCAN_BLOCK_SIZE:
+            yield from _secret_lines_in_blocks([self._read_bytes(file_path)])
+        else:
+            with open(file_path, "rb") as stream:
+                yield from _secret_lines_in_blocks(_iter_blocks(stream))
+    
+    def _in_output_dir(self, path: str) -> bool:
+        """Check whether an indexed file sits below a build output directory"""
+        return not OUTPUT_DIRS.isdisjoint(path[self._root_prefix_len:].split(os.sep)[:-1])
+    
+    def _exists(self, rel_path: str) -> bool:
+        """Check whether a "/"-separated path relative to the project root exists"""
+        rel_dir, _, name = rel_path.rpartition("/")
+        return name in self._list_dir(rel_dir)
+    
     def run_all_tests(self) -> Dict[str, RuleTestResult]:
         """Run all rule compliance tests"""
-        results = {}
-        
-        # Foundation Rules (01A-01C)
-        results.update(self.test_01a_design_principles())
-        results.update(self.test_01b_runtime_operations())
-        results.update(self.test_01c_governance())
-        
-        # Service Architecture (02A-02C)
-        results.update(self.test_02a_container_design())
-        results.update(self.test_02b_network_topology())
-        results.update(self.test_02c_service_metadata())
-        
-        # Security (03A-03C)
-        results.update(self.test_03a_authentication())
-        results.update(self.test_03b_authorization())
-        results.update(self.test_03c_security_encryption())
-        
-        # Database (04A-04B)
-        results.update(self.test_04a_database_design())
-        results.update(self.test_04b_database_operations())
-        
-        # Configuration (05A-05B)
-        results.update(self.test_05a_environment_config())
-        results.update(self.test_05b_secrets_management())
-        
-        # API Design (06A-06C)
-        results.update(self.test_06a_api_design())
-        results.update(self.test_06b_api_documentation())
-        results.update(self.test_06c_api_versioning())
-        
-        # Testing (07A-07C)
-        results.update(self.test_07a_testing_strategy())
-        results.update(self.test_07b_test_implementation())
-        results.update(self.test_07c_test_automation())
-        
-        # Observability (08A-08C)
-        results.update(self.test_08a_error_handling())
-        results.update(self.test_08b_logging_standards())
-        results.update(self.test_08c_monitoring())
-        
-        # CI/CD (09A)
-        results.update(self.test_09a_cicd_pipelines())
+        return dict(self.iter_results(ordered=True))
+    
+    def iter_results(self, ordered: bool = False) -> Iterator[Tuple[str, RuleTestResult]]:
+        """Run all rule compliance tests, yielding each result as it completes, or in rule order if ordered"""
+        tests = [
+            # Foundation Rules (01A-01C)
+            self.test_01a_design_principles,
+            self.test_01b_runtime_operations,
+            self.test_01c_governance,
+            # Service Architecture (02A-02C)
+            self.test_02a_container_design,
+            self.test_02b_network_topology,
+            self.test_02c_service_metadata,
+            # Security (03A-03C)
+            self.test_03a_authentication,
+            self.test_03b_authorization,
+            self.test_03c_security_encryption,
+            # Database (04A-04B)
+            self.test_04a_database_design,
+            self.test_04b_database_operations,
+            # Configuration (05A-05B)
+            self.test_05a_environment_config,
+            self.test_05b_secrets_management,
+            # API Design (06A-06C)
+            self.test_06a_api_design,
+            self.test_06b_api_documentation,
+            self.test_06c_api_versioning,
+            # Testing (07A-07C)
+            self.test_07a_testing_strategy,
+            self.test_07b_test_implementation,
+            self.test_07c_test_automation,
+            # Observability (08A-08C)
+            self.test_08a_error_handling,
+            self.test_08b_logging_standards,
+            self.test_08c_monitoring,
+            # CI/CD (09A)
+            self.test_09a_cicd_pipelines,
+        ]
         
-        return results
+        # Threads rather than processes: the tests share the file index built
+        # in __init__ and spend most of their time in file I/O
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = [executor.submit(test) for test in tests]
+                for future in (futures if ordered else as_completed(futures)):
+                    yield from future.result().items()
+        finally:
+            # Release cached contents; a later run must see the files as they are then
+            self._file_cache.clear()
+    
+    def write_jsonl(self, stream: TextIO) -> int:
+        """Write one JSON record per rule as each test completes; return the MUST violation count"""
+        import json
+        
+        must_violations = 0
+        for _, result in self.iter_results():
+            stream.write(json.dumps(result.to_record()) + "\n")
+            stream.flush()
+            must_violations += len([v for v in result.violations if v.severity == Severity.MUST])
+        return must_violations
     
     def test_01a_design_principles(self) -> Dict[str, RuleTestResult]:
         """Test Rule 01A: Design & Architecture Principles"""
         violations = []
         
         # MUST have OpenAPI specification
-        openapi_files = list(self.project_root.rglob("openapi.yaml")) + \
-                       list(self.project_root.rglob("openapi.yml")) + \
-                       list(self.project_root.rglob("swagger.yaml"))
+        openapi_file = next(itertools.chain(
+            self._index.get("openapi.yaml", ()),
+            self._index.get("openapi.yml", ()),
+            self._index.get("swagger.yaml", ())
+        ), None)
         
-        if not openapi_files:
+        if openapi_file is None:
             violations.append(RuleViolation(
                 rule_id="01A-001",
                 severity=Severity.MUST,
@@ -106,8 +325,7 @@ class RuleTestRunner:
             ))
         
         # MUST have performance budget
-        perf_budget = self.project_root / "perf-budget.yaml"
-        if not perf_budget.exists():
+        if "perf-budget.yaml" not in self._root_entries:
             violations.append(RuleViolation(
                 rule_id="01A-002", 
                 severity=Severity.MUST,
@@ -117,8 +335,7 @@ class RuleTestRunner:
             ))
         
         # MUST have ADR documentation for distributed systems
-        adr_dir = self.project_root / "docs" / "adr"
-        if not adr_dir.exists():
+        if not self._exists("docs/adr"):
             violations.append(RuleViolation(
                 rule_id="01A-003",
                 severity=Severity.MUST, 
@@ -141,17 +358,15 @@ class RuleTestRunner:
         violations = []
         
         # Check for health endpoints in common config files
-        health_patterns = ["/health", "/healthz", "/ready"]
         found_health = False
         
-        for pattern in ["**/*.yaml", "**/*.yml", "**/*.json", "**/*.py", "**/*.js", "**/*.ts"]:
-            for file_path in self.project_root.rglob(pattern):
+        for suffix in [".yaml", ".yml", ".json", ".py", ".js", ".ts"]:
+            for file_path in self._index.get(suffix, ()):
                 try:
-                    content = file_path.read_text()
-                    if any(hp in content for hp in health_patterns):
+                    if self._contains(file_path, HEALTH_NEEDLES):
                         found_health = True
                         break
-                except:
+                except OSError:
                     continue
             if found_health:
                 break
@@ -179,13 +394,14 @@ class RuleTestRunner:
         
         # MUST have Dockerfile
         dockerfile_paths = [
-            self.project_root / "Dockerfile",
-            self.project_root / "docker" / "Dockerfile",
-            self.project_root / "build" / "Dockerfile"
+            "Dockerfile",
+            "docker/Dockerfile",
+            "build/Dockerfile"
         ]
         
-        dockerfile_exists = any(path.exists() for path in dockerfile_paths)
-        if not dockerfile_exists:
+        # Only the first existing Dockerfile is checked
+        dockerfile = next((path for path in dockerfile_paths if self._exists(path)), None)
+        if dockerfile is None:
             violations.append(RuleViolation(
                 rule_id="02A-001",
                 severity=Severity.MUST,
@@ -194,30 +410,28 @@ class RuleTestRunner:
             ))
         else:
             # Check Dockerfile best practices
-            for dockerfile_path in dockerfile_paths:
-                if dockerfile_path.exists():
-                    content = dockerfile_path.read_text()
-                    
-                    # Check for non-root user
-                    if "USER " not in content:
-                        violations.append(RuleViolation(
-                            rule_id="02A-002",
-                            severity=Severity.MUST,
-                            description="Dockerfile missing non-root USER directive",
-                            file_path=str(dockerfile_path),
-                            suggestion="Add USER directive to run as non-root"
-                        ))
-                    
-                    # Check for health check
-                    if "HEALTHCHECK" not in content:
-                        violations.append(RuleViolation(
-                            rule_id="02A-003",
-                            severity=Severity.SHOULD,
-                            description="Dockerfile missing HEALTHCHECK directive",
-                            file_path=str(dockerfile_path),
-                            suggestion="Add HEALTHCHECK for container health monitoring"
-                        ))
-                    break
+            dockerfile_path = self.project_root / dockerfile
+            data = self._read_bytes(str(dockerfile_path))
+            
+            # Check for non-root user
+            if b"USER " not in data:
+                violations.append(RuleViolation(
+                    rule_id="02A-002",
+                    severity=Severity.MUST,
+                    description="Dockerfile missing non-root USER directive",
+                    file_path=str(dockerfile_path),
+                    suggestion="Add USER directive to run as non-root"
+                ))
+            
+            # Check for health check
+            if b"HEALTHCHECK" not in data:
+                violations.append(RuleViolation(
+                    rule_id="02A-003",
+                    severity=Severity.SHOULD,
+                    description="Dockerfile missing HEALTHCHECK directive",
+                    file_path=str(dockerfile_path),
+                    suggestion="Add HEALTHCHECK for container health monitoring"
+                ))
         
         return {
             "02A": RuleTestResult(
@@ -233,21 +447,23 @@ class RuleTestRunner:
         violations = []
         
         # Check for versioned API endpoints
-        api_files = list(self.project_root.rglob("*.py")) + \
-                   list(self.project_root.rglob("*.js")) + \
-                   list(self.project_root.rglob("*.ts")) + \
-                   list(self.project_root.rglob("*.go")) + \
-                   list(self.project_root.rglob("*.java"))
+        api_files = itertools.chain(
+            self._index.get(".py", ()),
+            self._index.get(".js", ()),
+            self._index.get(".ts", ()),
+            self._index.get(".go", ()),
+            self._index.get(".java", ())
+        )
+        api_files = (path for path in api_files if not self._in_output_dir(path))
         
         versioned_endpoints_found = False
         for file_path in api_files:
             try:
-                content = file_path.read_text()
                 # Look for versioned endpoints like /v1/, /v2/, etc.
-                if re.search(r'/v\d+/', content):
+                if self._search(file_path, VERSIONED_RE):
                     versioned_endpoints_found = True
                     break
-            except:
+            except OSError:
                 continue
         
         if not versioned_endpoints_found:
@@ -273,13 +489,13 @@ class RuleTestRunner:
         
         # Check for test directories
         test_dirs = [
-            self.project_root / "tests",
-            self.project_root / "test", 
-            self.project_root / "__tests__",
-            self.project_root / "spec"
+            "tests",
+            "test", 
+            "__tests__",
+            "spec"
         ]
         
-        test_dir_exists = any(path.exists() and path.is_dir() for path in test_dirs)
+        test_dir_exists = any(self._root_entries.get(name, False) for name in test_dirs)
         if not test_dir_exists:
             violations.append(RuleViolation(
                 rule_id="07A-001",
@@ -297,7 +513,7 @@ class RuleTestRunner:
             "vitest.config.js"
         ]
         
-        config_exists = any((self.project_root / config).exists() for config in test_configs)
+        config_exists = any(config in self._root_entries for config in test_configs)
         if not config_exists:
             violations.append(RuleViolation(
                 rule_id="07A-002",
@@ -329,7 +545,7 @@ class RuleTestRunner:
             ".circleci/config.yml"
         ]
         
-        cicd_exists = any((self.project_root / config).exists() for config in cicd_files)
+        cicd_exists = any(self._exists(config) for config in cicd_files)
         if not cicd_exists:
             violations.append(RuleViolation(
                 rule_id="09A-001",
@@ -340,20 +556,23 @@ class RuleTestRunner:
         
         # Check GitHub Actions specifically
         gh_workflows = self.project_root / ".github" / "workflows"
-        if gh_workflows.exists():
-            workflow_files = list(gh_workflows.glob("*.yml")) + list(gh_workflows.glob("*.yaml"))
+        if self._exists(".github/workflows"):
+            workflow_files = [
+                path for path in itertools.chain(self._index.get(".yml", ()), self._index.get(".yaml", ()))
+                if os.path.dirname(path) == str(gh_workflows)
+            ]
             if workflow_files:
                 # Check for required stages in workflows
-                required_stages = ["test", "build", "security"]
+                required_stages = [b"test", b"build", b"security"]
                 for workflow_file in workflow_files:
-                    content = workflow_file.read_text()
-                    missing_stages = [stage for stage in required_stages if stage not in content.lower()]
+                    data = self._read_bytes(workflow_file).translate(ASCII_LOWER)
+                    missing_stages = [stage.decode() for stage in required_stages if stage not in data]
                     if missing_stages:
                         violations.append(RuleViolation(
                             rule_id="09A-002",
                             severity=Severity.SHOULD,
                             description=f"Workflow missing stages: {', '.join(missing_stages)}",
-                            file_path=str(workflow_file),
+                            file_path=workflow_file,
                             suggestion="Add test, build, and security stages to pipeline"
                         ))
         
@@ -371,17 +590,16 @@ class RuleTestRunner:
         violations = []
         
         # Check for authentication-related files/configs
-        auth_patterns = ["auth", "jwt", "oauth", "saml", "ldap"]
         auth_files_found = False
         
-        for pattern in ["**/*.yaml", "**/*.yml", "**/*.json", "**/*.env*"]:
-            for file_path in self.project_root.rglob(pattern):
+        env_files = [path for path in self._files if ".env" in os.path.basename(path)]
+        for files in [self._index.get(".yaml", ()), self._index.get(".yml", ()), self._index.get(".json", ()), env_files]:
+            for file_path in files:
                 try:
-                    content = file_path.read_text().lower()
-                    if any(auth_pattern in content for auth_pattern in auth_patterns):
+                    if self._search(file_path, AUTH_RE):
                         auth_files_found = True
                         break
-                except:
+                except OSError:
                     continue
             if auth_files_found:
                 break
@@ -407,36 +625,48 @@ class RuleTestRunner:
         """Test Rule 05B: Secrets Management"""
         violations = []
         
-        # Check for hardcoded secrets (basic patterns)
-        secret_patterns = [
-            r'password\s*=\s*["\'][^"\']+["\']',
-            r'api_key\s*=\s*["\'][^"\']+["\']',
-            r'secret\s*=\s*["\'][^"\']+["\']',
-            r'token\s*=\s*["\'][^"\']+["\']'
-        ]
-        
-        code_files = list(self.project_root.rglob("*.py")) + \
-                    list(self.project_root.rglob("*.js")) + \
-                    list(self.project_root.rglob("*.ts")) + \
-                    list(self.project_root.rglob("*.java")) + \
-                    list(self.project_root.rglob("*.go"))
+        # Check for hardcoded secrets (basic patterns, see SECRET_RE)
+        code_files = itertools.chain(
+            self._index.get(".py", ()),
+            self._index.get(".js", ()),
+            self._index.get(".ts", ()),
+            self._index.get(".java", ()),
+            self._index.get(".go", ())
+        )
         
         for file_path in code_files:
+            # Identical lines (e.g. a repeated literal) are reported once
+            seen = set()
+            line_numbers = []
             try:
-                content = file_path.read_text()
-                for i, line in enumerate(content.split('\n'), 1):
-                    for pattern in secret_patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
-                            violations.append(RuleViolation(
-                                rule_id="05B-001",
-                                severity=Severity.MUST,
-                                description="Potential hardcoded secret found",
-                                file_path=str(file_path),
-                                line_number=i,
-                                suggestion="Move secrets to environment variables or secret management system"
-                            ))
-            except:
+                for i, line in self._secret_lines(file_path):
+                    normalized = line.strip()
+                    if normalized not in seen:
+                        seen.add(normalized)
+                        line_numbers.append(i)
+            except OSError:
+                continue
+            
+            if len(line_numbers) > SECRET_REPORT_LIMIT:
+                violations.append(RuleViolation(
+                    rule_id="05B-001",
+                    severity=Severity.MUST,
+                    description=f"{len(line_numbers)} potential hardcoded secrets found",
+                    file_path=file_path,
+                    line_number=line_numbers[0],
+                    suggestion="Move secrets to environment variables or secret management system"
+                ))
                 continue
+            
+            for i in line_numbers:
+                violations.append(RuleViolation(
+                    rule_id="05B-001",
+                    severity=Severity.MUST,
+                    description="Potential hardcoded secret found",
+                    file_path=file_path,
+                    line_number=i,
+                    suggestion="Move secrets to environment variables or secret management system"
+                ))
         
         return {
             "05B": RuleTestResult(
@@ -460,7 +690,7 @@ class RuleTestRunner:
             "winston.config.js"
         ]
         
-        config_exists = any((self.project_root / config).exists() for config in logging_configs)
+        config_exists = any(config in self._root_entries for config in logging_configs)
         if not config_exists:
             violations.append(RuleViolation(
                 rule_id="08B-001",
@@ -528,7 +758,7 @@ class RuleTestRunner:
         total_violations = sum(len(r.violations) for r in results.values())
         must_violations = sum(len([v for v in r.violations if v.severity == Severity.MUST]) for r in results.values())
         
-        report = f"""
+        parts = [f"""
 # Universal Rules Compliance Report
 
 ## Summary
@@ -541,60 +771,75 @@ class RuleTestRunner:
 
 ## Detailed Results
 
-"""
+"""]
         
         for rule_id, result in sorted(results.items()):
             status = "✅ PASS" if result.passed else "❌ FAIL"
-            report += f"### {rule_id}: {status}\n"
-            report += f"{result.details}\n\n"
+            parts.append(f"### {rule_id}: {status}\n")
+            parts.append(f"{result.details}\n\n")
             
             if result.violations:
-                report += "**Violations:**\n"
+                parts.append("**Violations:**\n")
                 for violation in result.violations:
-                    report += f"- [{violation.severity.value}] {violation.description}"
+                    parts.append(f"- [{violation.severity.value}] {violation.description}")
                     if violation.file_path:
-                        report += f" ({violation.file_path}"
+                        parts.append(f" ({violation.file_path}")
                         if violation.line_number:
-                            report += f":{violation.line_number}"
-                        report += ")"
+                            parts.append(f":{violation.line_number}")
+                        parts.append(")")
                     if violation.suggestion:
-                        report += f"\n  💡 {violation.suggestion}"
-                    report += "\n"
-                report += "\n"
+                        parts.append(f"\n  💡 {violation.suggestion}")
+                    parts.append("\n")
+                parts.append("\n")
         
-        report += "\n## Recommendations\n"
+        parts.append("\n## Recommendations\n")
         if must_violations > 0:
-            report += f"🚨 **Critical**: Fix {must_violations} MUST violations immediately.\n"
+            parts.append(f"🚨 **Critical**: Fix {must_violations} MUST violations immediately.\n")
         
         if total_violations > must_violations:
             should_violations = total_violations - must_violations
-            report += f"⚠️ **Important**: Address {should_violations} SHOULD violations for best practices.\n"
+            parts.append(f"⚠️ **Important**: Address {should_violations} SHOULD violations for best practices.\n")
         
         if total_violations == 0:
-            report += "🎉 **Excellent**: All rules are compliant!\n"
+            parts.append("🎉 **Excellent**: All rules are compliant!\n")
         
-        return report
+        return "".join(parts)
 
 def main():
     """Main entry point"""
+    import argparse
     import sys
     
-    project_root = sys.argv[1] if len(sys.argv) > 1 else "."
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    parser = argparse.ArgumentParser(description="Validate project compliance with Universal Rules")
+    parser.add_argument("project_root", nargs="?", default=".", help="project directory to check (default: .)")
+    parser.add_argument("output_file", nargs="?", help="write output to this file instead of stdout")
+    parser.add_argument("--format", choices=["markdown", "jsonl"], default="markdown",
+                        help="markdown report, or one JSON record per rule streamed as tests complete")
+    args = parser.parse_args()
     
-    runner = RuleTestRunner(project_root)
-    results = runner.run_all_tests()
-    report = runner.generate_report(results)
+    runner = RuleTestRunner(args.project_root)
     
-    if output_file:
-        with open(output_file, 'w') as f:
-            f.write(report)
-        print(f"Compliance report written to {output_file}")
+    if args.format == "jsonl":
+        if args.output_file:
+            with open(args.output_file, 'w') as f:
+                must_violations = runner.write_jsonl(f)
+            print(f"Compliance results written to {args.output_file}")
+        else:
+            must_violations = runner.write_jsonl(sys.stdout)
     else:
-        print(report)
+        results = runner.run_all_tests()
+        report = runner.generate_report(results)
+        
+        if args.output_file:
+            with open(args.output_file, 'w') as f:
+                f.write(report)
+            print(f"Compliance report written to {args.output_file}")
+        else:
+            print(report)
+        
+        must_violations = sum(len([v for v in r.violations if v.severity == Severity.MUST]) for r in results.values())
     
     # Exit with error code if there are MUST violations
-    must_violations = sum(len([v for v in r.violations if v.severity == Severity.MUST]) for r in results.values())
     sys.exit(1 if must_violations > 0 else 0)
 
 if __name__ == "__main__":